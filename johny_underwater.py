@@ -5,9 +5,9 @@ import sys
 from libs.constants import (MAP_DIR, PYGAME_ERROR, PYGAME_FAILED,
                             PYGAME_SUCCESS, SPRITE_DIR)
 from libs.engine import game_engine
-from libs.entity.animated import AnimEntity
 from libs.entity.moving import ProjectileEntity
 from libs.entity.player import player_obj
+from libs.particles import ParticleEmitter
 
 # set up main logger
 logger = logging.getLogger(__file__)
@@ -19,10 +19,8 @@ if __name__ == "__main__":
 
     game_engine.load_map(os.path.join(MAP_DIR, "test0.tmx"))
 
-    # create motionless animated bubbles
-    bubbles1 = AnimEntity("bubbles0")
-    bubbles1.rect.x = 20
-    bubbles1.rect.y = 20
+    # create ambient bubbles rising from the sea floor
+    bubbles1 = ParticleEmitter("bubbles0", (0, 440, 640, 40), rate=2)
 
     # create randomly moving static projectile
     arrow1 = ProjectileEntity("arrow0", "up", 5)
@@ -30,10 +28,12 @@ if __name__ == "__main__":
     arrow1.rect.y = 300
 
     # add objects to group
-    game_engine.entities.add(bubbles1)
     game_engine.entities.add(arrow1)
     game_engine.entities.add(player_obj)
 
+    # add ambient effects
+    game_engine.emitters.append(bubbles1)
+
     # get status code while exiting main loop
     exit_status = game_engine.main_loop()
 
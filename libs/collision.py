@@ -0,0 +1,145 @@
+"""
+    Collision masks and broadphase/narrowphase collision pipeline
+
+    author: Andy Mender <andymenderunix@gmail.com>
+    date: 2018-12-14
+"""
+
+import logging
+from collections import defaultdict
+from itertools import islice
+from typing import Iterable, List, Tuple
+
+import pygame
+
+from libs.constants import COLLISION_CELL_SIZE
+
+# set up logging
+logger = logging.getLogger(__file__)
+
+# collision masks shared by all entities, keyed by animation frame Surface
+# NOTE: frames are cached and shared as well, so each mask is built only once,
+# when an entity first shows the frame
+mask_cache: dict = {}
+
+
+def get_mask(frame: pygame.Surface) -> pygame.mask.Mask:
+    """Get collision mask for an animation frame, building it on first use.
+
+    :param frame: loaded sprite frame
+    :return: pixel mask shared by all entities using the frame
+    """
+
+    mask = mask_cache.get(frame)
+
+    if mask is None:
+        mask = pygame.mask.from_surface(frame)
+        mask_cache[frame] = mask
+
+    return mask
+
+
+class CollisionPipeline:
+    """Two-phase collision detector for sprites with 'rect' and 'mask' attributes.
+
+    Cheap rect overlap tests (broadphase) select candidate pairs,
+    which are then checked pixel by pixel via mask overlap (narrowphase).
+    """
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        # size of uniform grid cells used by the broadphase
+        self.cell_size: int = cell_size
+
+        # rect test count and pair counts per phase from the last run
+        self.stats = {"rect_tests": 0, "broadphase": 0, "narrowphase": 0}
+
+    def broadphase(self, sprites: list) -> List[Tuple[pygame.sprite.Sprite, pygame.sprite.Sprite]]:
+        """Collect sprite pairs with overlapping rects.
+
+        Updates 'rect_tests' with the number of rect checks run, which can
+        exceed the number of pairs, since large rects share several grid cells.
+
+        :param sprites: sprites to check against each other
+        :return: candidate pairs for mask checks
+        """
+
+        cell_size = self.cell_size
+        rects = [sprite.rect for sprite in sprites]
+
+        # bucket sprite indices into every grid cell their rect touches
+        cells = defaultdict(list)
+
+        for idx, rect in enumerate(rects):
+            for cell_x in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                for cell_y in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                    cells[(cell_x, cell_y)].append(idx)
+
+        candidates = []
+        rect_tests = 0
+
+        # only sprites sharing a cell can overlap
+        for cell, members in cells.items():
+            for pos, idx_a in enumerate(members):
+                rect_a = rects[idx_a]
+
+                # only check against later members to skip mirrored pairs
+                for idx_b in islice(members, pos + 1, None):
+                    rect_tests += 1
+                    rect_b = rects[idx_b]
+
+                    if not rect_a.colliderect(rect_b):
+                        continue
+
+                    # report each pair once - from the cell holding
+                    # the top-left corner of the rect intersection
+                    overlap = rect_a.clip(rect_b)
+
+                    if (overlap.x // cell_size, overlap.y // cell_size) == cell:
+                        candidates.append((sprites[idx_a], sprites[idx_b]))
+
+        self.stats["rect_tests"] = rect_tests
+        self.stats["broadphase"] = len(candidates)
+
+        return candidates
+
+    def narrowphase(self, candidates: list) -> List[Tuple[pygame.sprite.Sprite, pygame.sprite.Sprite]]:
+        """Filter candidate pairs down to pixel-accurate hits.
+
+        :param candidates: pairs accepted by the broadphase
+        :return: pairs with overlapping masks
+        """
+
+        hits = []
+
+        for sprite_a, sprite_b in candidates:
+            # sprites without masks are treated as solid rects
+            if sprite_a.mask is None or sprite_b.mask is None:
+                hits.append((sprite_a, sprite_b))
+                continue
+
+            offset = (sprite_b.rect.x - sprite_a.rect.x,
+                      sprite_b.rect.y - sprite_a.rect.y)
+
+            if sprite_a.mask.overlap(sprite_b.mask, offset) is not None:
+                hits.append((sprite_a, sprite_b))
+
+        self.stats["narrowphase"] = len(hits)
+
+        return hits
+
+    def collide(self, sprites: Iterable[pygame.sprite.Sprite]) -> List[Tuple[pygame.sprite.Sprite, pygame.sprite.Sprite]]:
+        """Run full collision pipeline on a sprite collection.
+
+        :param sprites: sprites or sprite group to check
+        :return: colliding sprite pairs
+        """
+
+        hits = self.narrowphase(self.broadphase(list(sprites)))
+
+        # skip message formatting unless debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Collision stats - rect tests: {self.stats['rect_tests']},"
+                         f" broadphase pairs: {self.stats['broadphase']},"
+                         f" narrowphase pairs: {self.stats['narrowphase']}")
+
+        return hits
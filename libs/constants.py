@@ -31,6 +31,7 @@ SCREEN_SIZE: tuple = (640, 480)
 TITLE_BAR: str = "Johny Underwater"
 FPS: int = 8
 COLLISION_COLOR: tuple = (255, 0, 0, 100)
+COLLISION_CELL_SIZE: int = 32
 LINE_COLOR: tuple = (0, 255, 0)
 ANIM_RESET: int = 30
 
@@ -41,3 +42,6 @@ MOVEMENT_KEYS = (pygame.K_UP, pygame.K_DOWN,
 
 # animation constants
 ANIM_GROUPS = ("idle", "up", "down", "left", "right")
+
+# particle constants
+PARTICLE_CAPACITY: int = 4096
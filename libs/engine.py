@@ -12,10 +12,12 @@ import pygame
 import pytmx
 from pytmx.util_pygame import load_pygame
 
+from libs.collision import CollisionPipeline
 from libs.constants import (COLLISION_COLOR, FPS, LINE_COLOR, PYGAME_ERROR,
                             PYGAME_FAILED, PYGAME_SUCCESS, SCREEN_SIZE,
                             TITLE_BAR)
 from libs.entity.player import player_obj
+from libs.entity.spawner import EntitySpawner, is_entity_object
 
 # set up logging
 logger = logging.getLogger(__file__)
@@ -36,6 +38,10 @@ class Engine:
         self.map = None
         self.collision_map = None          # TODO: populate with collision coordinates
         self.entities = None
+        self.map_entities = None           # entities spawned from map objects
+        self.emitters = None
+        self.spawner = EntitySpawner()
+        self.collisions = CollisionPipeline()
 
         # link pygame and set flags
         self.screen_flags = pygame.HWSURFACE | pygame.DOUBLEBUF
@@ -62,6 +68,10 @@ class Engine:
 
         # prepare entity container for tracking
         self.entities = pygame.sprite.Group()
+        self.map_entities = pygame.sprite.Group()
+
+        # prepare particle emitters for ambient effects
+        self.emitters = []
 
         # start the game clock
         self.clock = pygame.time.Clock()
@@ -91,10 +101,20 @@ class Engine:
             # redraw map to remove dead objects
             self.refresh_map()
 
+            # update and draw ambient particles below entities
+            for emitter in self.emitters:
+                emitter.update()
+                emitter.draw(self.screen)
+
             # update entity state and redraw
             self.entities.update()
             self.entities.draw(self.screen)
 
+            # detect colliding entities after movement and let both react
+            for entity_a, entity_b in self.collisions.collide(self.entities):
+                entity_a.handle_collision(entity_b)
+                entity_b.handle_collision(entity_a)
+
             # refresh main display surface
             pygame.display.update()
 
@@ -124,7 +144,9 @@ class Engine:
 
                     for obj in layer:
 
-                        # TODO: load entities from map objects
+                        # entity objects are spawned by load_entities()
+                        if is_entity_object(obj):
+                            continue
 
                         # objects with points are polygons or lines
                         if hasattr(obj, "points") and obj.points is not None:
@@ -157,6 +179,21 @@ class Engine:
                     if hasattr(layer, "image") and layer.image is not None:
                         self.screen.blit(layer.image, (0, 0))
 
+    def load_entities(self) -> None:
+        """Spawn entities from object layers of currently loaded map."""
+
+        # remove entities spawned from previous map
+        # NOTE: hand-added entities (player, etc.) are kept
+        for entity in self.map_entities:
+            entity.kill()
+
+        for layer in self.map.layers:
+            if isinstance(layer, pytmx.TiledObjectGroup):
+                spawned = self.spawner.spawn_objects(layer)
+
+                self.map_entities.add(*spawned)
+                self.entities.add(*spawned)
+
     def load_map(self, map_file: str) -> bool:
         """Load and render a Tiled game map.
 
@@ -173,9 +210,17 @@ class Engine:
             logger.warning(f"Path to map file does not exist: {map_file}")
             return False
 
+        # entity groups are only set up by init()
+        if self.entities is None:
+            logger.warning("Engine not initialized, call init() before loading maps.")
+            return False
+
         # extract data from mapfile and link to Engine
         self.map = load_pygame(map_file)
 
+        # populate entity group from map objects
+        self.load_entities()
+
         # send map sprites and objects to display surface
         self.refresh_map()
 
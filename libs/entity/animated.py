@@ -9,15 +9,60 @@ import logging
 import os.path
 import re
 
-import pygame
-
 from libs.constants import ANIM_GROUPS, ANIM_RESET, SPRITE_DIR
-from libs.entity.base import Entity
+from libs.entity.base import Entity, MovementMixin, load_frame
 from libs.utilities import timestamp_now
 
 # set up logging
 logger = logging.getLogger(__file__)
 
+# animation frame lists shared by all entities, keyed by (sprite group, anim group)
+anim_cache: dict = {}
+
+
+def load_anim_frames(sprite_group: str, anim_group: str) -> list:
+    """Load animation frames for a single animation 'state'.
+
+    Directory listings and frame loads happen only once per animation group.
+
+    :param sprite_group: sprite group (entity) name
+    :param anim_group: animation group (state) name
+    :return: list of frames shared by all callers - do not modify!
+    """
+
+    cache_key = (sprite_group, anim_group)
+
+    if cache_key in anim_cache:
+        return anim_cache[cache_key]
+
+    # only collect valid frame images
+    # TODO: allow more than 10 frames?
+    anim_format = re.compile("_[0-9]\\.png$")
+
+    anim_dir = os.path.join(SPRITE_DIR, sprite_group, anim_group)
+
+    # fail if directory defining state is missing
+    if not os.path.isdir(anim_dir):
+        raise FileNotFoundError(f"Anim group directory missing: {anim_dir}")
+
+    anim_listing = sorted(os.listdir(anim_dir))
+
+    if len(anim_listing) == 0:
+        raise FileNotFoundError("At least 1 animation frame per state is required!")
+
+    frames = []
+
+    for anim_file in anim_listing:
+        if anim_format.search(anim_file):
+            anim_path = os.path.join(anim_dir, anim_file)
+
+            # load and store animation frame (shared by all instances)
+            frames.append(load_frame(anim_path))
+
+    anim_cache[cache_key] = frames
+
+    return frames
+
 
 class AnimEntity(Entity):
     """Entity child class with animation frames."""
@@ -39,10 +84,6 @@ class AnimEntity(Entity):
     def load_animations(self) -> None:
         """Load all animation frames into attribute dict."""
 
-        # only collect valid frame images
-        # TODO: allow more than 10 frames?
-        anim_format = re.compile("_[0-9]\.png$")
-
         # collection for frame numbers for all animation groups
         frame_numbers = []
 
@@ -52,25 +93,9 @@ class AnimEntity(Entity):
 
         # collect animation frames for each animation 'state'
         for anim_group in self.anim_groups:
-            anim_dir = os.path.join(SPRITE_DIR, self.name, anim_group)
-
-            # fail if directory defining state is missing
-            if not os.path.isdir(anim_dir):
-                raise FileNotFoundError(f"Anim group directory missing: {anim_dir}")
-
-            anim_listing = sorted(os.listdir(anim_dir))
-
-            if len(anim_listing) == 0:
-                raise FileNotFoundError("At least 1 animation frame per state is required!")
-
-            for anim_file in anim_listing:
-                if anim_format.search(anim_file):
-                    anim_path = os.path.join(anim_dir, anim_file)
-
-                    # load and store animation frame
-                    self.anim_groups[anim_group].append(pygame.image.load(anim_path))
+            self.anim_groups[anim_group] = load_anim_frames(self.name, anim_group)
 
-                # collect frame counts
+            # collect frame counts
             frame_numbers.append(len(self.anim_groups[anim_group]))
 
         # count until the shortest animation's last frame
@@ -102,7 +127,7 @@ class AnimEntity(Entity):
         super().update()
 
 
-class MovingAnimEntity(AnimEntity):
+class MovingAnimEntity(MovementMixin, AnimEntity):
     """Base class for objects implementing animations dependent on movement."""
 
     def __init__(self, sprite_group: str, speed: int = 1):
@@ -122,12 +147,7 @@ class MovingAnimEntity(AnimEntity):
         self.clock = timestamp_now()
 
         # movement mapper
-        self.movements = {
-            "up": self.move_up,
-            "down": self.move_down,
-            "left": self.move_left,
-            "right": self.move_right
-        }
+        self.bind_movements()
 
     def move_up(self) -> None:
         self.rect.y -= self.speed
@@ -5,6 +5,7 @@
     date: 2018-11-04
 """
 
+import copy
 import logging
 import os
 import os.path
@@ -12,11 +13,28 @@ from typing import Union
 
 import pygame
 
+from libs.collision import get_mask
 from libs.constants import SPRITE_DIR
+from libs.utilities import timestamp_now
 
 # set up logging
 logger = logging.getLogger(__file__)
 
+# sprite frames shared by all entities, keyed by file path
+frame_cache: dict = {}
+
+
+def load_frame(sprite_path: str) -> pygame.Surface:
+    """Load sprite frame from file once and reuse it afterwards."""
+
+    frame = frame_cache.get(sprite_path)
+
+    if frame is None:
+        frame = pygame.image.load(sprite_path)
+        frame_cache[sprite_path] = frame
+
+    return frame
+
 
 class Entity(pygame.sprite.Sprite):
     """Base class for in-game entities."""
@@ -27,6 +45,7 @@ class Entity(pygame.sprite.Sprite):
     # placeholders for sprite objects
     image = None
     rect = None
+    mask = None
 
     # base entity attributes
     hp: Union[float, int] = 1
@@ -64,11 +83,14 @@ class Entity(pygame.sprite.Sprite):
         """Load sprite from file or from pre-loaded Surface."""
 
         if type(sprite_obj) == str:
-            self.image = pygame.image.load(sprite_obj)
+            self.image = load_frame(sprite_obj)
 
         elif type(sprite_obj) == pygame.Surface:
             self.image = sprite_obj
 
+        # pick up shared collision mask for current frame
+        self.mask = get_mask(self.image)
+
         # apply current 'x' and 'y' coordinates to new sprite rect
         # NOTE: prevents coordinate reset
         if self.rect is not None:
@@ -78,6 +100,27 @@ class Entity(pygame.sprite.Sprite):
         else:
             self.rect = self.image.get_rect()
 
+    def clone(self) -> "Entity":
+        """Create a cheap copy of the entity for batch spawning.
+
+        Loaded frames and masks are shared with the original, so no disk I/O happens.
+        """
+
+        entity = copy.copy(self)
+
+        # drop sprite group membership copied from the original
+        pygame.sprite.Sprite.__init__(entity)
+
+        # give the copy its own position
+        entity.rect = self.rect.copy()
+
+        return entity
+
+    def handle_collision(self, other: "Entity") -> None:
+        """React to a collision with another entity - overridden in child classes."""
+
+        pass
+
     def is_alive(self) -> None:
         """Check for entity "alive" status."""
 
@@ -89,3 +132,26 @@ class Entity(pygame.sprite.Sprite):
 
         # check "alive" status
         self.is_alive()
+
+
+class MovementMixin:
+    """Shared movement mapper handling for entities implementing 'move_*' methods."""
+
+    def bind_movements(self) -> None:
+        """Map movement directions to movement methods of this instance."""
+
+        self.movements = {"up": self.move_up,
+                          "down": self.move_down,
+                          "left": self.move_left,
+                          "right": self.move_right}
+
+    def clone(self) -> Entity:
+        """Create a cheap copy of the entity with its own movement state."""
+
+        entity = super().clone()
+
+        # rebind movement state to the copy
+        entity.clock = timestamp_now()
+        entity.bind_movements()
+
+        return entity
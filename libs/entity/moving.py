@@ -9,7 +9,7 @@ import logging
 import random
 
 from libs.constants import ANIM_GROUPS, ANIM_RESET
-from libs.entity.base import Entity
+from libs.entity.base import Entity, MovementMixin
 from libs.entity.animated import MovingAnimEntity
 from libs.utilities import timestamp_now
 
@@ -17,8 +17,7 @@ from libs.utilities import timestamp_now
 logger = logging.getLogger(__file__)
 
 
-# TODO: add collision detection to movement methods
-class MovingEntity(Entity):
+class MovingEntity(MovementMixin, Entity):
     """Entity child class with movement implementation."""
 
     def __init__(self, sprite_group: str, speed: int = 1):
@@ -31,10 +30,7 @@ class MovingEntity(Entity):
         self.clock = timestamp_now()
 
         # movement mapper
-        self.movements = {"up": self.move_up,
-                          "down": self.move_down,
-                          "left": self.move_left,
-                          "right": self.move_right}
+        self.bind_movements()
 
     def move_up(self) -> None:
         self.rect.y -= self.speed
@@ -105,7 +101,7 @@ class ProjectileEntity(MovingEntity):
     """Base class for unidirectionally moving projectiles
     (bolts, arrows, fireballs, etc.)"""
 
-    def __init__(self, sprite_group: str, direction: str, speed: int = 1):
+    def __init__(self, sprite_group: str, direction: str = "up", speed: int = 1):
 
         # set vector direction via internal state
         self.state = direction
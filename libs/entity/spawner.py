@@ -0,0 +1,158 @@
+"""
+    Prototype-based entity spawning from Tiled map objects
+
+    author: Andy Mender <andymenderunix@gmail.com>
+    date: 2018-12-16
+"""
+
+import logging
+from typing import Iterable, List, Optional
+
+import pytmx
+
+from libs.entity.animated import AnimEntity, load_anim_frames
+from libs.entity.base import Entity, MovementMixin
+from libs.entity.moving import ProjectileEntity, RandomMovingEntity
+
+# set up logging
+logger = logging.getLogger(__file__)
+
+# map object types which spawn entities
+# NOTE: set as object "Type" in Tiled, sprite group via "sprite_group" property or object name
+ENTITY_TYPES: dict = {
+    "anim": AnimEntity,
+    "creature": RandomMovingEntity,
+    "pickup": AnimEntity,
+    "projectile": ProjectileEntity,
+}
+
+
+def is_entity_object(obj: pytmx.TiledObject) -> bool:
+    """Check if map object describes a spawnable entity."""
+
+    return getattr(obj, "type", None) in ENTITY_TYPES
+
+
+class EntitySpawner:
+    """Spawns entities from map objects by cloning one prototype per sprite group."""
+
+    def __init__(self):
+        # fully loaded entities to clone from, keyed by (type, sprite group)
+        # NOTE: None marks sprite groups which failed to load
+        self.prototypes: dict = {}
+
+    def get_prototype(self, entity_type: str, sprite_group: str) -> Optional[Entity]:
+        """Get prototype entity, constructing it on first use.
+
+        A failed construction is logged once and remembered, so broken
+        sprite groups don't trigger repeated disk I/O.
+
+        :param entity_type: map object type
+        :param sprite_group: sprite group (entity) name
+        :return: prototype entity - clone it, don't add it to groups! None on failure
+        """
+
+        cache_key = (entity_type, sprite_group)
+
+        if cache_key not in self.prototypes:
+            try:
+                self.prototypes[cache_key] = ENTITY_TYPES[entity_type](sprite_group)
+
+            except (ValueError, FileNotFoundError) as err:
+                logger.warning(f"Could not load '{entity_type}' prototype"
+                               f" for sprite group '{sprite_group}': {err}")
+                self.prototypes[cache_key] = None
+
+        return self.prototypes[cache_key]
+
+    def spawn(self, obj: pytmx.TiledObject) -> Optional[Entity]:
+        """Create entity from a single map object.
+
+        :param obj: Tiled map object with entity type
+        :return: new entity placed at object coordinates, None if prototype failed to load
+        """
+
+        properties = obj.properties
+        sprite_group = properties.get("sprite_group", obj.name)
+
+        if sprite_group is None:
+            raise ValueError("Map object needs a name or 'sprite_group' property!")
+
+        prototype = self.get_prototype(obj.type, sprite_group)
+
+        if prototype is None:
+            return None
+
+        entity = prototype.clone()
+        entity.rect.x, entity.rect.y = int(obj.x), int(obj.y)
+
+        # movement properties only apply to moving entities
+        is_moving = isinstance(entity, MovementMixin)
+
+        # apply per-object overrides
+        if "speed" in properties and not is_moving:
+            raise ValueError(f"Entity type '{obj.type}' can't have 'speed' property")
+
+        # NOTE: untyped Tiled properties are loaded as strings
+        try:
+            if "hp" in properties:
+                entity.hp = float(properties["hp"])
+
+            if "speed" in properties:
+                entity.speed = int(properties["speed"])
+
+        except (TypeError, ValueError) as err:
+            raise ValueError(f"Invalid 'hp' or 'speed' property: {properties}") from err
+
+        if "direction" in properties:
+            direction = properties["direction"]
+
+            # direction must have both a movement and an animation group (where present)
+            if not is_moving or direction not in entity.movements:
+                raise ValueError(f"Entity type '{obj.type}' can't move in direction: {direction}")
+
+            anim_groups = getattr(entity, "anim_groups", None)
+
+            if anim_groups is not None:
+                if direction not in anim_groups:
+                    raise ValueError(f"No animations for direction '{direction}' in sprite group: {sprite_group}")
+
+                frames = anim_groups[direction]
+            else:
+                frames = load_anim_frames(entity.name, direction)
+
+            if len(frames) == 0:
+                raise ValueError(f"No frames for direction '{direction}' in sprite group: {sprite_group}")
+
+            entity.state = direction
+
+            # show first frame matching the new direction
+            entity.load_sprite(frames[0])
+
+        return entity
+
+    def spawn_objects(self, objects: Iterable[pytmx.TiledObject]) -> List[Entity]:
+        """Create entities from all spawnable map objects.
+
+        :param objects: Tiled map objects, e.g. a TiledObjectGroup
+        :return: list of new entities
+        """
+
+        entities = []
+
+        for obj in objects:
+            if not is_entity_object(obj):
+                continue
+
+            try:
+                entity = self.spawn(obj)
+
+            except (ValueError, FileNotFoundError) as err:
+                logger.warning(f"Could not spawn entity from map object {obj.id}: {err}")
+                continue
+
+            # failed prototypes are already reported by get_prototype()
+            if entity is not None:
+                entities.append(entity)
+
+        return entities
@@ -0,0 +1,139 @@
+"""
+    Particle emitters for bubbles and other ambient effects
+
+    author: Andy Mender <andymenderunix@gmail.com>
+    date: 2018-12-15
+"""
+
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+import pygame
+
+from libs.constants import PARTICLE_CAPACITY
+from libs.entity.animated import load_anim_frames
+
+# set up logging
+logger = logging.getLogger(__file__)
+
+
+class ParticleEmitter:
+    """Batched particle system sharing a single sprite group's animation frames.
+
+    Particle state lives in NumPy arrays, so emitting, moving and retiring
+    particles happens in bulk instead of per-sprite Python calls.
+
+    NOTE: requires an initialised display, frames are converted to display format.
+    """
+
+    def __init__(self, sprite_group: str, area: Tuple[int, int, int, int],
+                 rate: int = 0, velocity: Tuple[float, float] = (0.0, -1.0),
+                 spread: Tuple[float, float] = (0.5, 0.5),
+                 lifetime: Tuple[int, int] = (20, 60),
+                 capacity: int = PARTICLE_CAPACITY):
+        # assign name from sprite group and pick up shared "idle" frames
+        self.name = sprite_group
+        frames = load_anim_frames(sprite_group, "idle")
+        self.frame_num: int = len(frames)
+
+        if self.frame_num == 0:
+            raise ValueError(f"No animation frames found for sprite group: {sprite_group}")
+
+        # object array allows picking frames for all particles in one step
+        # NOTE: display-format copies avoid pixel conversion on every blit,
+        # shared frames stay untouched since 'mask_cache' is keyed by them
+        self.frames = np.empty(self.frame_num, dtype=object)
+        self.frames[:] = [frame.convert_alpha() for frame in frames]
+
+        # emission parameters
+        self.area = pygame.Rect(area)
+        self.rate: int = rate
+        self.velocity = np.array(velocity, dtype=np.float32)
+        self.spread = np.array(spread, dtype=np.float32)
+        self.lifetime: Tuple[int, int] = lifetime
+
+        # particle state arrays - only first 'count' entries are alive
+        self.capacity: int = capacity
+        self.count: int = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.frame = np.zeros(capacity, dtype=np.int32)
+
+        self.rng = np.random.default_rng()
+
+    def emit(self, num: int, area: Optional[pygame.Rect] = None) -> int:
+        """Spawn a batch of particles at random positions inside an area.
+
+        :param num: number of particles to spawn
+        :param area: spawn area as Rect or (x, y, width, height), defaults to emitter area
+        :return: number of particles actually spawned
+        """
+
+        if area is None:
+            area = self.area
+        else:
+            area = pygame.Rect(area)
+
+        # drop particles which don't fit
+        num = min(num, self.capacity - self.count)
+
+        if num <= 0:
+            return 0
+
+        start, end = self.count, self.count + num
+
+        self.pos[start:end, 0] = self.rng.uniform(area.left, area.right, num)
+        self.pos[start:end, 1] = self.rng.uniform(area.top, area.bottom, num)
+        self.vel[start:end] = self.velocity + self.rng.uniform(-1.0, 1.0, (num, 2)) * self.spread
+        self.life[start:end] = self.rng.integers(self.lifetime[0], self.lifetime[1] + 1, num)
+
+        # random starting frame prevents synchronized animations
+        self.frame[start:end] = self.rng.integers(0, self.frame_num, num)
+
+        self.count = end
+
+        return num
+
+    def retire(self) -> None:
+        """Remove expired particles by compacting alive ones to the front."""
+
+        alive = self.life[:self.count] > 0
+        alive_num = int(np.count_nonzero(alive))
+
+        if alive_num == self.count:
+            return
+
+        self.pos[:alive_num] = self.pos[:self.count][alive]
+        self.vel[:alive_num] = self.vel[:self.count][alive]
+        self.life[:alive_num] = self.life[:self.count][alive]
+        self.frame[:alive_num] = self.frame[:self.count][alive]
+
+        self.count = alive_num
+
+    def update(self) -> None:
+        """Emit new particles, advance existing ones and retire expired ones."""
+
+        if self.rate > 0:
+            self.emit(self.rate)
+
+        count = self.count
+
+        self.pos[:count] += self.vel[:count]
+        self.life[:count] -= 1
+        self.frame[:count] += 1
+        self.frame[:count] %= self.frame_num
+
+        self.retire()
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Render all alive particles in a single batched blit."""
+
+        if self.count == 0:
+            return
+
+        images = self.frames[self.frame[:self.count]]
+        coords = self.pos[:self.count].astype(np.int32).tolist()
+
+        surface.blits(zip(images, coords), doreturn=False)